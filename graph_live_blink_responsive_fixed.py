@@ -2,19 +2,54 @@
 # BLE Browser with browser-like top tabs + renaming (CustomTkinter + Bleak)
 
 import asyncio
+import collections
+import sys
 import threading
-import re
+import struct
+import time
 import tkinter as tk
-from typing import Optional, Dict, List, Tuple, Union
+from functools import partial
+from typing import Optional, DefaultDict, Deque, Dict, List, Tuple, Union
 
 import customtkinter as ctk
 from bleak import BleakScanner, BleakClient
 
+# optional: libuv-backed loop for the bridge thread (no Windows support)
+try:
+    if sys.platform == "win32":
+        raise ImportError
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# status frame: status, error, temperature[4], pressure[6], level[2], flowrate[4] (u16 big-endian)
+STATUS_STRUCT = struct.Struct(">BB4H6H2H4H")
+
+# GATT property bits, computed once per characteristic at discovery
+PROP_READ = 1
+PROP_WRITE = 2
+PROP_WRITE_NR = 4
+PROP_NOTIFY = 8
+PROP_INDICATE = 16
+_PROP_BITS = {"read": PROP_READ, "write": PROP_WRITE, "write-without-response": PROP_WRITE_NR,
+              "notify": PROP_NOTIFY, "indicate": PROP_INDICATE}
+
+# browser-tab frame colors
+TAB_BG_ACTIVE = "#e5e5e5"
+TAB_BG_IDLE = "#1f1f1f"
+
+# device list is a plain tk.Listbox, so it gets its palette and font by hand
+DEVICE_LIST_LIGHT = {"bg": "#f5f5f5", "fg": "#1a1a1a", "selectbackground": "#3b8ed0", "selectforeground": "#ffffff"}
+DEVICE_LIST_DARK = {"bg": "#2b2b2b", "fg": "#dce4ee", "selectbackground": "#1f6aa5", "selectforeground": "#ffffff"}
+DEVICE_LIST_FONT = ("Consolas", 11)  # size at 100% widget scaling
+
 
 # ---------- Async bridge ----------
 class AsyncioBridge:
-    def __init__(self):
-        self.loop = asyncio.new_event_loop()
+    def __init__(self, on_error=None):
+        self.on_error = on_error  # on_error(exc), called on the loop thread for fired coroutines
+        self.loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+        self._tasks = set()  # strong refs so fire-and-forget tasks are not collected mid-flight
         self.thread = threading.Thread(target=self._run_loop, daemon=True)
         self.thread.start()
 
@@ -25,6 +60,32 @@ class AsyncioBridge:
     def run_coro(self, coro):
         return asyncio.run_coroutine_threadsafe(coro, self.loop)
 
+    def fire(self, coro, on_done=None):
+        """Schedule coro without a concurrent Future; on_done() runs on the loop thread after it."""
+        async def runner():
+            try:
+                await coro
+            except Exception as exc:
+                # nobody awaits a fired task: report here or it only surfaces at GC time
+                if self.on_error:
+                    self.on_error(exc)
+                else:
+                    raise
+            finally:
+                if on_done:
+                    on_done()
+        self.loop.call_soon_threadsafe(self._spawn, runner())
+
+    def _spawn(self, coro):
+        task = self.loop.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._reap)
+
+    def _reap(self, task):
+        self._tasks.discard(task)
+        if not task.cancelled():
+            task.exception()  # mark retrieved; runner() already reported it
+
     def stop(self):
         try:
             if self.loop.is_running():
@@ -34,6 +95,23 @@ class AsyncioBridge:
                 self.thread.join(timeout=1.0)
 
 
+# ---------- Per-characteristic page ----------
+class CharPage:
+    """Widgets of one characteristic page (right-bottom pane)."""
+    __slots__ = ("frame", "props", "text", "btn_read", "btn_sub", "btn_write", "backlog", "header")
+
+    def __init__(self, frame, props, text, btn_read, btn_sub, btn_write):
+        self.frame: ctk.CTkFrame = frame
+        self.props: ctk.CTkLabel = props
+        self.text: ctk.CTkTextbox = text
+        self.btn_read: ctk.CTkButton = btn_read
+        self.btn_sub: ctk.CTkButton = btn_sub
+        self.btn_write: ctk.CTkButton = btn_write
+        # lines received while the page is hidden; flushed into `text` when shown
+        self.backlog: Deque[str] = collections.deque(maxlen=500)
+        self.header: str = props.cget("text")  # last text pushed to `props`
+
+
 # ---------- App ----------
 class BLEBrowserApp(ctk.CTk):
     def __init__(self):
@@ -45,28 +123,53 @@ class BLEBrowserApp(ctk.CTk):
         self.geometry("1280x800")
         self.minsize(1100, 650)
 
-        self.bridge = AsyncioBridge()
+        self.bridge = AsyncioBridge(on_error=self._on_bridge_error)
 
         self.devices = []  # list[BLEDevice]
+        self.device_addrs: List[str] = []  # parallel to self.devices, resolved once in _on_adv
+        # filled by the scanner callback (bleak thread); address -> BLEDevice
+        self._scan_found: Dict[str, object] = {}
+        self._scan_lock = threading.Lock()
+        self._scan_refresh_pending = False
+        self._scan_refresh_ms = 200
+        self._scan_refresh_job: Optional[str] = None
+        self._closing = False  # set by on_close; worker-thread callbacks stop scheduling Tk work
         self.client: Optional[BleakClient] = None
         self.connected_address: Optional[str] = None
 
-        # char_uuid -> (service_uuid, char_obj, handle)
-        self.char_index: Dict[str, Tuple[str, object, int]] = {}
+        # char_uuid -> (service_uuid, char_obj, handle, PROP_* mask, props_text)
+        self.char_index: Dict[str, Tuple[str, object, int, int, str]] = {}
+        self._handle_to_uuid: Dict[int, str] = {}  # reverse of char_index for notify routing
         self.notify_active_uuid: Optional[str] = None
 
+        # notify packets are queued by the bleak thread and drained on the Tk thread
+        self._notif_queue: Deque[Tuple[str, bytes]] = collections.deque(maxlen=256)
+        self._notif_lock = threading.Lock()
+        self._notif_drain_ms = 50  # minimum spacing between drains
+        self._notif_drain_job: Optional[str] = None
+        self._notif_drain_armed = False  # guarded by _notif_lock
+        self._notif_last_drain = 0.0
+
         # UI state
         self.compact_values = ctk.BooleanVar(value=True)
+        self.max_log_lines = 2000  # per textbox; older lines are dropped
+        self._pending_scale: Optional[float] = None
+        self._applied_scale = 1.0  # matches the "100%" default in the toolbar
+        self._scale_job: Optional[str] = None
 
         # Byte editor variables
         self.byte_entries: List[ctk.StringVar] = []
         self.byte_name_entries: List[ctk.StringVar] = []
+        self.max_byte_size = 512  # largest GATT attribute value
 
         # Top-tab bar + per-char pages
         self.active_tab_uuid: Optional[str] = None
         self.browser_tabs: Dict[str, Dict[str, object]] = {}   # uuid -> {frame, btn, close}
-        self.char_pages: Dict[str, Dict[str, object]] = {}     # uuid -> {frame, props, text, btn_read, btn_sub, btn_write}
+        self.char_pages: Dict[str, CharPage] = {}
         self.tab_titles: Dict[str, str] = {}                   # uuid -> display name
+        # pages of closed tabs, kept for reopening (oldest evicted first)
+        self._page_pool: "collections.OrderedDict[str, CharPage]" = collections.OrderedDict()
+        self.max_pooled_pages = 8
         self.max_tab_title_len = 28
 
         # right-click menu for tabs
@@ -77,6 +180,7 @@ class BLEBrowserApp(ctk.CTk):
 
         self._build_ui()
         self.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.bind("<Map>", self._on_map)
 
     # ---------- UI ----------
     def _build_ui(self):
@@ -132,8 +236,20 @@ class BLEBrowserApp(ctk.CTk):
         ctk.CTkLabel(dev_box, text="Discovered Devices").grid(row=0, column=0, sticky="w", padx=10, pady=(10, 0))
 
         self.device_var = ctk.StringVar(value="")
-        self.device_list = ctk.CTkScrollableFrame(dev_box, height=180)
-        self.device_list.grid(row=1, column=0, sticky="nsew", padx=10, pady=(6, 10))
+        # one native Listbox instead of a CTk widget per device
+        list_frame = ctk.CTkFrame(dev_box)
+        list_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=(6, 10))
+        list_frame.grid_columnconfigure(0, weight=1)
+        list_frame.grid_rowconfigure(0, weight=1)
+        self.device_list = tk.Listbox(list_frame, height=8, activestyle="none", borderwidth=0,
+                                      highlightthickness=0, exportselection=False, font=DEVICE_LIST_FONT)
+        self.device_list.grid(row=0, column=0, sticky="nsew", padx=(6, 0), pady=6)
+        dev_scroll = ctk.CTkScrollbar(list_frame, command=self.device_list.yview)
+        dev_scroll.grid(row=0, column=1, sticky="ns", pady=6)
+        self.device_list.configure(yscrollcommand=dev_scroll.set)
+        self.device_list.bind("<<ListboxSelect>>", lambda e: self._on_device_list_select())
+        self._device_row_last: List[str] = []  # row texts currently in the Listbox
+        self._style_device_list("dark")
 
         # Controls panel
         ctl_box = ctk.CTkFrame(mid)
@@ -144,6 +260,9 @@ class BLEBrowserApp(ctk.CTk):
 
         ctk.CTkLabel(ctl_box, text="Characteristic:").grid(row=1, column=0, sticky="w", padx=10, pady=(6, 6))
         self.char_var = ctk.StringVar(value="")
+        self._last_combo_items: List[str] = []
+        # last (props_text, read, write, notify, subscribed) pushed to the toolbar
+        self._ctl_state: Optional[Tuple[str, bool, bool, bool, bool]] = None
         self.char_combo = ctk.CTkComboBox(ctl_box, variable=self.char_var, values=[], width=600,
                                           command=lambda _: self._on_char_selected())
         self.char_combo.grid(row=1, column=1, columnspan=2, sticky="ew", padx=8, pady=6)
@@ -174,10 +293,16 @@ class BLEBrowserApp(ctk.CTk):
 
         self.byte_editor_frame = ctk.CTkFrame(ctl_box, fg_color="transparent")
         self.byte_editor_frame.grid(row=4, column=0, columnspan=4, sticky="ew", padx=10, pady=(0, 10))
-        self.byte_editor_frame.grid_columnconfigure(0, weight=1)
+        self.byte_editor_frame.grid_columnconfigure(3, weight=1)  # filler right of name/value/index
+        self._byte_editor_header = False
+        # pooled editor rows: (name_var, value_var, (name_entry, value_entry, index_lbl))
+        self._byte_editor_rows: List[Tuple[ctk.StringVar, ctk.StringVar, Tuple[object, object, object]]] = []
         self.write_btn = ctk.CTkButton(ctl_box, text="Write Bytes", state="disabled", command=self.on_write)
         self.write_btn.grid(row=5, column=3, padx=(8, 10), pady=(0, 10), sticky="e")
 
+        # disabled whenever there is no live connection
+        self._conn_only_widgets = (self.disconnect_btn, self.read_btn, self.write_btn, self.notify_btn)
+
         # --- Bottom panes: Log | Right (Decoded + Values + Per-char page) ---
         bottom = ctk.CTkFrame(self)
         bottom.grid(row=3, column=0, sticky="nsew", padx=12, pady=(0, 12))
@@ -201,7 +326,8 @@ class BLEBrowserApp(ctk.CTk):
         ctk.CTkLabel(right, text="Decoded Status").grid(row=0, column=0, sticky="w", padx=10, pady=(10, 0))
         self.decoded_frame = ctk.CTkScrollableFrame(right)
         self.decoded_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=(6, 10))
-        self._decoded_rows: Dict[str, Tuple[ctk.CTkLabel, ctk.CTkLabel]] = {}
+        self._decoded_rows: Dict[str, Tuple[ctk.CTkFrame, ctk.CTkLabel, str]] = {}  # name -> (row, value, last text)
+        self._deferred_status: Optional[bytes] = None  # latest frame seen while minimized
 
         values_hdr = ctk.CTkFrame(right, fg_color="transparent")
         values_hdr.grid(row=2, column=0, sticky="ew", padx=10, pady=(0, 0))
@@ -222,51 +348,124 @@ class BLEBrowserApp(ctk.CTk):
     # ---------- Helpers ----------
     def _change_theme(self, mode):
         ctk.set_appearance_mode(mode)
+        self._style_device_list(mode)
+
+    def _style_device_list(self, mode: str):
+        # plain tk widget: does not follow the CTk appearance mode on its own
+        self.device_list.configure(**(DEVICE_LIST_LIGHT if mode == "light" else DEVICE_LIST_DARK))
 
     def _change_scale(self, value):
-        pct = int(value.strip("%"))
-        ctk.set_widget_scaling(pct / 100.0)
+        # every widget redraws on a scaling change, so coalesce rapid picks into one
+        self._pending_scale = int(value.strip("%")) / 100.0
+        if self._scale_job:
+            self.after_cancel(self._scale_job)
+        self._scale_job = self.after(150, self._apply_scale)
+
+    def _apply_scale(self):
+        self._scale_job = None
+        # re-picking the current value (or toggling back within the debounce) is a no-op
+        if self._pending_scale is not None and self._pending_scale != self._applied_scale:
+            ctk.set_widget_scaling(self._pending_scale)
+            self._applied_scale = self._pending_scale
+            # CTk does not rescale plain tk widgets
+            family, size = DEVICE_LIST_FONT
+            self.device_list.configure(font=(family, round(size * self._applied_scale)))
+
+    def _on_bridge_error(self, exc: Exception):
+        self._post_to_tk(self.log, f"[ERROR] {type(exc).__name__}: {exc}")
+
+    def _post_to_tk(self, fn, *args):
+        """Hand a result from the bridge thread to Tk; dropped once on_close has started."""
+        if self._closing:
+            return
+        # idle callback: no millisecond timer like after(0)
+        self.after_idle(fn, *args)
 
     def set_status(self, s: str):
         self.status_lbl.configure(text=s)
-        self.update_idletasks()
 
     def log(self, text: str):
         self.output.insert("end", text + "\n")
+        self._trim_textbox(self.output)
         self.output.see("end")
-        if text.startswith("[READ ") or text.startswith("[NOTIF "):
-            line = self._compact_line(text) if self.compact_values.get() else text
+        if "[READ " not in text and "[NOTIF " not in text:
+            return
+        # text may hold several lines (batched notifications)
+        values = [ln for ln in text.split("\n") if ln.startswith("[READ ") or ln.startswith("[NOTIF ")]
+        if values:
+            if self.compact_values.get():
+                values = [self._compact_line(ln) for ln in values]
             self.values_txt.configure(state="normal")
-            self.values_txt.insert("end", line + "\n")
+            self.values_txt.insert("end", "\n".join(values) + "\n")
+            self._trim_textbox(self.values_txt)
             self.values_txt.see("end")
             self.values_txt.configure(state="disabled")
 
+    def _trim_textbox(self, box: ctk.CTkTextbox):
+        lines = int(box.index("end-1c").split(".")[0])
+        if lines > self.max_log_lines:
+            box.delete("1.0", f"{lines - self.max_log_lines}.0")
+
+    def _report(self, uuid: str, msg: str, page_msg: Optional[str] = None, status: Optional[bytes] = None):
+        """Single Tk-thread hop for a BLE op result: global log, char page, decoded panel."""
+        self.log(msg)
+        self._append_to_char_page(uuid, msg if page_msg is None else page_msg)
+        if status is not None:
+            # decoded here, like notify frames, so the bleak loop only formats the log line
+            self._update_decoded(self._decode_status(status))
+
+    @staticmethod
+    def _format_value_line(tag: str, uuid: str, data: bytes) -> str:
+        """'[TAG uuid] AA BB … (len=N)' with at most 64 bytes shown."""
+        length = len(data)
+        hex_str = memoryview(data)[:64].hex(" ").upper()  # no slice copy
+        return f"[{tag} {uuid}] {hex_str}" + (f" … (len={length})" if length > 64 else f" (len={length})")
+
     @staticmethod
     def _compact_line(text: str) -> str:
-        m = re.search(r"\]\s+(.*)", text)
-        if not m:
+        idx = text.find("] ")
+        if idx < 0:
             return text
-        rest = m.group(1)
-        rest = re.split(r"\s…|\s\(len=", rest, maxsplit=1)[0]
-        rest = re.sub(r"\(Handle:[^)]+\)\s*", "", rest)
+        rest = text[idx + 2:].lstrip()  # like the old r"\]\s+": empty payloads keep "(len=0)"
+        # drop the trailing "… (len=N)" / "(len=N)" suffix
+        for marker in (" …", " (len="):
+            cut = rest.find(marker)
+            if cut >= 0:
+                rest = rest[:cut]
+        # drop any "(Handle: …)" annotations
+        while "(Handle:" in rest:
+            head, _, tail = rest.partition("(Handle:")
+            _, closed, tail = tail.partition(")")
+            if not closed:
+                break
+            rest = head + tail.lstrip()
         return rest.strip()
 
     # ---------- Device list ----------
     def _refresh_device_list(self):
-        for child in self.device_list.winfo_children():
-            child.destroy()
-        for idx, d in enumerate(self.devices):
-            name = d.name or "(Unknown)"
-            addr = getattr(d, "address", getattr(d, "mac_address", "??"))
-            rb = ctk.CTkRadioButton(
-                self.device_list,
-                text=f"{name}   [{addr}]",
-                variable=self.device_var,
-                value=str(idx),
-                command=self._on_device_pick,
-                width=800,
-            )
-            rb.pack(fill="x", padx=6, pady=3, anchor="w")
+        last = self._device_row_last
+        rows = [f"{d.name or '(Unknown)'}   [{addr}]" for d, addr in zip(self.devices, self.device_addrs)]
+        for idx, text in enumerate(rows):
+            if idx >= len(last):
+                self.device_list.insert("end", text)
+            elif last[idx] != text:
+                self.device_list.delete(idx)
+                self.device_list.insert(idx, text)
+        if len(last) > len(rows):
+            self.device_list.delete(len(rows), "end")
+        self._device_row_last = rows
+
+        v = self.device_var.get()
+        if v and int(v) < len(rows):
+            self.device_list.selection_set(int(v))
+        else:
+            self.device_var.set("")
+            self._on_device_pick()
+
+    def _on_device_list_select(self):
+        sel = self.device_list.curselection()
+        self.device_var.set(str(sel[0]) if sel else "")
+        self._on_device_pick()
 
     def _on_device_pick(self):
         self.connect_btn.configure(state=("normal" if self.device_var.get() else "disabled"))
@@ -291,11 +490,36 @@ class BLEBrowserApp(ctk.CTk):
         self.values_txt.configure(state="disabled")
         self._clear_decoded()
 
-        fut = self.bridge.run_coro(self._scan_async())
-        fut.add_done_callback(lambda _f: self.after(0, self._scan_done))
+        self.bridge.fire(self._scan_async(), partial(self._post_to_tk, self._scan_done))
 
     async def _scan_async(self):
-        self.devices = await BleakScanner.discover(timeout=5.0)
+        with self._scan_lock:
+            self._scan_found.clear()
+        async with BleakScanner(detection_callback=self._on_adv):
+            await asyncio.sleep(5.0)
+        with self._scan_lock:
+            self.devices = list(self._scan_found.values())
+            self.device_addrs = list(self._scan_found.keys())
+
+    def _on_adv(self, device, _adv):
+        addr = getattr(device, "address", getattr(device, "mac_address", "??"))
+        with self._scan_lock:
+            is_new = addr not in self._scan_found
+            self._scan_found[addr] = device
+            # repeat adverts only refresh the stored device; the list redraws for new addresses
+            if not is_new or self._scan_refresh_pending or self._closing:
+                return
+            self._scan_refresh_pending = True
+        self._scan_refresh_job = self.after(self._scan_refresh_ms, self._scan_refresh)
+
+    def _scan_refresh(self):
+        """Show devices found so far; rearmed by _on_adv at most every _scan_refresh_ms."""
+        self._scan_refresh_job = None
+        with self._scan_lock:
+            self._scan_refresh_pending = False
+            self.devices = list(self._scan_found.values())
+            self.device_addrs = list(self._scan_found.keys())
+        self._refresh_device_list()
 
     def _scan_done(self):
         self._refresh_device_list()
@@ -317,13 +541,14 @@ class BLEBrowserApp(ctk.CTk):
         self.connect_btn.configure(state="disabled")
         self.disconnect_btn.configure(state="disabled")
 
-        fut = self.bridge.run_coro(self._connect_and_list(address))
-        fut.add_done_callback(lambda _f: self.after(0, self._post_connect_ui))
+        self.bridge.fire(self._connect_and_list(address), partial(self._post_to_tk, self._post_connect_ui))
 
     async def _connect_and_list(self, address: str):
         self.client = BleakClient(address)
         self.char_index.clear()
-        self._populate_char_combo([])
+        self._handle_to_uuid.clear()
+        # keep the old menu until discovery finishes; same-profile reconnects then skip the rebuild
+        self.char_var.set("")
 
         try:
             await self.client.connect(timeout=10.0)
@@ -331,85 +556,133 @@ class BLEBrowserApp(ctk.CTk):
             self.connected_address = address if ok else None
         except Exception as exc:
             self.connected_address = None
-            self.after(0, lambda m=str(exc): self.log(f"Connect failed: {m}"))
+            self._post_to_tk(self.log, f"Connect failed: {exc}")
+            self._post_to_tk(self._populate_char_combo, [])
             return
 
         connected_flag = bool(getattr(self.client, "is_connected", False))
-        self.after(0, lambda s=connected_flag: self.log(f"Connected: {s}"))
+        self._post_to_tk(self.log, f"Connected: {connected_flag}")
 
         try:
             services_coll = getattr(self.client, "services", None)
-            if not services_coll or len(list(services_coll)) == 0:
+            if not self._has_services(services_coll):
                 get_services = getattr(self.client, "get_services", None)
                 if callable(get_services):
                     services_coll = await get_services()
-            if not services_coll:
-                self.after(0, lambda: self.log("No GATT services found."))
+            if not self._has_services(services_coll):
+                self._post_to_tk(self.log, "No GATT services found.")
+                self._post_to_tk(self._populate_char_combo, [])
                 return
         except Exception as exc:
-            self.after(0, lambda m=f"Failed to obtain services: {exc}": self.log(m))
+            self._post_to_tk(self.log, f"Failed to obtain services: {exc}")
+            self._post_to_tk(self._populate_char_combo, [])
             return
 
+        # walk the GATT tree on a worker thread so the loop keeps servicing bleak
+        char_index, handle_map, log_lines, char_items = await asyncio.to_thread(
+            self._summarize_services, services_coll
+        )
+        self.char_index = char_index
+        self._handle_to_uuid = handle_map
+
+        self._post_to_tk(self.log, "\n".join(log_lines))
+        self._post_to_tk(self._populate_char_combo, char_items)
+
+    @staticmethod
+    def _has_services(services_coll) -> bool:
+        # BleakGATTServiceCollection has no __len__ on every bleak version; probe one item
+        if not services_coll:
+            return False
+        try:
+            return len(services_coll) > 0
+        except TypeError:
+            return next(iter(services_coll), None) is not None
+
+    @staticmethod
+    def _summarize_services(services_coll):
+        """Build (char_index, handle->uuid, log lines, combo items) from a service collection."""
+        char_index: Dict[str, Tuple[str, object, int, int, str]] = {}
+        handle_map: Dict[int, str] = {}
+        log_lines: List[str] = []
         char_items: List[str] = []
         for svc in services_coll:
-            self.after(0, lambda s=svc: self.log(f"[Service] {s.uuid}: {s.description}"))
+            log_lines.append(f"[Service] {svc.uuid}: {svc.description}")
             for ch in svc.characteristics:
                 props = ",".join(ch.properties)
-                self.after(0, lambda c=ch, p=props: self.log(f"  [Char] {c.uuid}: {c.description} (props: {p})"))
+                log_lines.append(f"  [Char] {ch.uuid}: {ch.description} (props: {props})")
                 uuid = str(ch.uuid)
-                self.char_index[uuid] = (str(svc.uuid), ch, ch.handle)
+                mask = 0
+                for p in ch.properties:
+                    mask |= _PROP_BITS.get(p, 0)
+                char_index[uuid] = (str(svc.uuid), ch, ch.handle, mask, props or "-")
+                handle_map[ch.handle] = uuid
                 char_items.append(uuid)
-
-        self.after(0, lambda items=char_items: self._populate_char_combo(items))
+        return char_index, handle_map, log_lines, char_items
 
     def _populate_char_combo(self, items: List[str]):
-        self.char_combo.configure(values=items)
+        if items != self._last_combo_items:
+            self.char_combo.configure(values=items)
+            self._last_combo_items = list(items)
         self.char_var.set(items[0] if items else "")
         if items:
             self._on_char_selected()
 
     def _on_char_selected(self):
         uuid = self.char_var.get()
-        props = []
+        mask = 0
+        props_text = "-"
         if uuid and uuid in self.char_index:
-            _svc_uuid, ch, _handle = self.char_index[uuid]
-            props = list(getattr(ch, "properties", []))
-        self.props_lbl.configure(text=f"Props: {','.join(props) if props else '-'}")
-
-        self.read_btn.configure(state=("normal" if "read" in props else "disabled"))
-        self.write_btn.configure(state=("normal" if ("write" in props or "write-without-response" in props) else "disabled"))
-        self.notify_btn.configure(state=("normal" if "notify" in props or "indicate" in props else "disabled"))
-        self.notify_btn.configure(text=("Unsubscribe" if self.notify_active_uuid == uuid else "Subscribe"))
+            _svc_uuid, _ch, _handle, mask, props_text = self.char_index[uuid]
+        state = (props_text, bool(mask & PROP_READ),
+                 bool(mask & (PROP_WRITE | PROP_WRITE_NR)),
+                 bool(mask & (PROP_NOTIFY | PROP_INDICATE)),
+                 self.notify_active_uuid == uuid)
+        if state != self._ctl_state:
+            self._ctl_state = state
+            _text, can_read, can_write, can_notify, subscribed = state
+            self.props_lbl.configure(text=f"Props: {props_text}")
+            self.read_btn.configure(state=("normal" if can_read else "disabled"))
+            self.write_btn.configure(state=("normal" if can_write else "disabled"))
+            self.notify_btn.configure(state=("normal" if can_notify else "disabled"),
+                                      text=("Unsubscribe" if subscribed else "Subscribe"))
 
         if uuid:
             self._ensure_browser_tab(uuid)
             self._ensure_char_page(uuid)
             self._select_browser_tab(uuid)
 
-    def _post_connect_ui(self):
-        if self.client and getattr(self.client, "is_connected", False):
+    def _apply_connection_state(self, connected: bool):
+        """Single place for the toolbar/control state change on (dis)connect."""
+        if connected:
             self.set_status(f"Connected to {self.connected_address}")
             self.disconnect_btn.configure(state="normal")
-        else:
-            self.set_status("Disconnected")
-        self.connect_btn.configure(state="normal")
+            self.connect_btn.configure(state="normal")
+            return
+        self.set_status("Disconnected")
+        self.connect_btn.configure(state=("normal" if self.device_var.get() else "disabled"))
+        for w in self._conn_only_widgets:
+            w.configure(state="disabled")
+        self.notify_btn.configure(text="Subscribe")
+        self._ctl_state = None
+        self._clear_decoded()
+
+    def _post_connect_ui(self):
+        self._apply_connection_state(bool(self.client and getattr(self.client, "is_connected", False)))
 
     def on_disconnect(self):
         if not (self.client and getattr(self.client, "is_connected", False)):
-            self.set_status("Disconnected")
-            self.disconnect_btn.configure(state="disabled")
+            self._apply_connection_state(False)
             return
 
         self.set_status("Disconnecting…")
-        fut = self.bridge.run_coro(self._disconnect_async())
-        fut.add_done_callback(lambda _f: self.after(0, self._post_disconnect_ui))
+        self.bridge.fire(self._disconnect_async(), partial(self._post_to_tk, self._post_disconnect_ui))
 
     async def _disconnect_async(self):
         try:
             if self.notify_active_uuid:
                 try:
                     if self.notify_active_uuid in self.char_index:
-                        _, _, handle = self.char_index[self.notify_active_uuid]
+                        handle = self.char_index[self.notify_active_uuid][2]
                         await self.client.stop_notify(handle)
                 except Exception:
                     pass
@@ -419,34 +692,23 @@ class BLEBrowserApp(ctk.CTk):
             pass
 
     def _post_disconnect_ui(self):
-        self.set_status("Disconnected")
-        self.disconnect_btn.configure(state="disabled")
-        self.notify_btn.configure(text="Subscribe", state="disabled")
-        self.read_btn.configure(state="disabled")
-        self.write_btn.configure(state="disabled")
-        self._clear_decoded()
+        self._apply_connection_state(False)
 
     # ---------- Read / Write / Notify ----------
     def on_read(self):
         uuid = self.char_var.get()
         if not uuid:
             return
-        fut = self.bridge.run_coro(self._read_async(uuid))
-        fut.add_done_callback(lambda _f: None)
+        self.bridge.fire(self._read_async(uuid))
 
     async def _read_async(self, uuid: str):
         try:
             data = await self.client.read_gatt_char(uuid)
-            hex_str = " ".join(f"{b:02X}" for b in data[:64])
-            msg = f"[READ {uuid}] {hex_str}" + (f" … (len={len(data)})" if len(data) > 64 else f" (len={len(data)})")
-            self.after(0, lambda m=msg: self.log(m))
-            self.after(0, lambda u=uuid, m=msg: self._append_to_char_page(u, m))
-            if len(data) >= 34:
-                decoded = self._decode_status(data)
-                self.after(0, lambda d=decoded: self._update_decoded(d))
+            msg = self._format_value_line("READ", uuid, data)
+            status = bytes(data) if len(data) >= STATUS_STRUCT.size else None
+            self._post_to_tk(self._report, uuid, msg, None, status)
         except Exception as exc:
-            self.after(0, lambda m=f"[READ {uuid}] Failed: {exc}": self.log(m))
-            self.after(0, lambda u=uuid, m=f"[READ {uuid}] Failed: {exc}": self._append_to_char_page(u, m))
+            self._post_to_tk(self._report, uuid, f"[READ {uuid}] Failed: {exc}")
 
     def on_write(self):
         uuid = self.char_var.get()
@@ -455,62 +717,51 @@ class BLEBrowserApp(ctk.CTk):
         payload = self._get_bytes_from_editor()
         if payload is None:
             return
-        fut = self.bridge.run_coro(self._write_async(uuid, payload))
-        fut.add_done_callback(lambda _f: None)
+        self.bridge.fire(self._write_async(uuid, payload))
 
     async def _write_async(self, uuid: str, payload: bytes):
         try:
-            props = []
-            if uuid in self.char_index:
-                _svc_uuid, ch, _handle = self.char_index[uuid]
-                props = list(getattr(ch, "properties", []))
-            noresp = "write-without-response" in props and "write" not in props
+            mask = self.char_index[uuid][3] if uuid in self.char_index else 0
+            noresp = (mask & (PROP_WRITE | PROP_WRITE_NR)) == PROP_WRITE_NR
             await self.client.write_gatt_char(uuid, payload, response=not noresp)
-            shown = " ".join(f"{b:02X}" for b in payload[:64])
+            shown = payload[:64].hex(" ").upper()
             msg = f"[WRITE {uuid}] {shown}" + (" …" if len(payload) > 64 else "")
-            self.after(0, lambda m=msg: self.log(m))
-            self.after(0, lambda u=uuid, m=msg: self._append_to_char_page(u, m))
+            self._post_to_tk(self._report, uuid, msg)
         except Exception as exc:
-            self.after(0, lambda m=f"[WRITE {uuid}] Failed: {exc}": self.log(m))
-            self.after(0, lambda u=uuid, m=f"[WRITE {uuid}] Failed: {exc}": self._append_to_char_page(u, m))
+            self._post_to_tk(self._report, uuid, f"[WRITE {uuid}] Failed: {exc}")
 
     def on_toggle_notify(self):
         uuid = self.char_var.get()
         if not uuid:
             return
         if self.notify_active_uuid == uuid:
-            fut = self.bridge.run_coro(self._stop_notify_async(uuid))
-            fut.add_done_callback(lambda _f: self.after(0, self._notify_stopped_ui_for, uuid))
+            self.bridge.fire(self._stop_notify_async(uuid), partial(self._post_to_tk, self._notify_stopped_ui_for, uuid))
         else:
-            fut = self.bridge.run_coro(self._start_notify_async(uuid))
-            fut.add_done_callback(lambda _f: self.after(0, self._notify_started_ui_for, uuid))
+            self.bridge.fire(self._start_notify_async(uuid), partial(self._post_to_tk, self._notify_started_ui_for, uuid))
 
     async def _start_notify_async(self, uuid: str):
         try:
             if uuid in self.char_index:
-                _svc_uuid, _ch, handle = self.char_index[uuid]
+                handle = self.char_index[uuid][2]
                 await self.client.start_notify(handle, self._notification_handler)
                 self.notify_active_uuid = uuid
-                self.after(0, lambda: self.log(f"[NOTIFY {uuid}] Subscribed using handle {handle}"))
-                self.after(0, lambda u=uuid: self._append_to_char_page(u, f"[NOTIFY {uuid}] Subscribed"))
+                self._post_to_tk(self._report, uuid, f"[NOTIFY {uuid}] Subscribed using handle {handle}",
+                                 f"[NOTIFY {uuid}] Subscribed")
             else:
-                self.after(0, lambda: self.log(f"[NOTIFY {uuid}] Characteristic not found in index"))
+                self._post_to_tk(self.log, f"[NOTIFY {uuid}] Characteristic not found in index")
         except Exception as exc:
-            self.after(0, lambda m=f"[NOTIFY {uuid}] Failed to subscribe: {exc}": self.log(m))
-            self.after(0, lambda u=uuid, m=f"[NOTIFY {uuid}] Failed to subscribe: {exc}": self._append_to_char_page(u, m))
+            self._post_to_tk(self._report, uuid, f"[NOTIFY {uuid}] Failed to subscribe: {exc}")
 
     async def _stop_notify_async(self, uuid: str):
         try:
             if uuid in self.char_index:
-                _svc_uuid, _ch, handle = self.char_index[uuid]
+                handle = self.char_index[uuid][2]
                 await self.client.stop_notify(handle)
-                self.after(0, lambda: self.log(f"[NOTIFY {uuid}] Unsubscribed"))
-                self.after(0, lambda u=uuid: self._append_to_char_page(u, f"[NOTIFY {uuid}] Unsubscribed"))
+                self._post_to_tk(self._report, uuid, f"[NOTIFY {uuid}] Unsubscribed")
             else:
-                self.after(0, lambda: self.log(f"[NOTIFY {uuid}] Characteristic not found in index"))
+                self._post_to_tk(self.log, f"[NOTIFY {uuid}] Characteristic not found in index")
         except Exception as exc:
-            self.after(0, lambda m=f"[NOTIFY {uuid}] Failed to unsubscribe: {exc}": self.log(m))
-            self.after(0, lambda u=uuid, m=f"[NOTIFY {uuid}] Failed to unsubscribe: {exc}": self._append_to_char_page(u, m))
+            self._post_to_tk(self._report, uuid, f"[NOTIFY {uuid}] Failed to unsubscribe: {exc}")
         finally:
             if self.notify_active_uuid == uuid:
                 self.notify_active_uuid = None
@@ -530,7 +781,7 @@ class BLEBrowserApp(ctk.CTk):
         # default title = FULL UUID (your request)
         self.tab_titles[uuid] = uuid
 
-        tab = ctk.CTkFrame(self.tabs_strip, corner_radius=12, fg_color="#1f1f1f")
+        tab = ctk.CTkFrame(self.tabs_strip, corner_radius=12, fg_color=TAB_BG_IDLE)
         tab.pack(side="left", padx=(0, 6), pady=2)
 
         btn = ctk.CTkButton(tab, text="", width=200, height=26,
@@ -579,11 +830,13 @@ class BLEBrowserApp(ctk.CTk):
                 self._refresh_page_header(uuid)
 
     def _select_browser_tab(self, uuid: str):
+        prev = self.active_tab_uuid
         self.active_tab_uuid = uuid
-        # Highlight active tab
-        for u, ref in self.browser_tabs.items():
-            frame: ctk.CTkFrame = ref["frame"]  # type: ignore
-            frame.configure(fg_color=("#e5e5e5" if u == uuid else "#1f1f1f"))
+        # Highlight active tab; only the previous and new tab change color
+        if prev != uuid and prev in self.browser_tabs:
+            self.browser_tabs[prev]["frame"].configure(fg_color=TAB_BG_IDLE)  # type: ignore
+        if uuid in self.browser_tabs:
+            self.browser_tabs[uuid]["frame"].configure(fg_color=TAB_BG_ACTIVE)  # type: ignore
         # Raise page
         self._show_char_page(uuid)
         # Mirror selection to combo
@@ -605,7 +858,12 @@ class BLEBrowserApp(ctk.CTk):
             frame.destroy()
         page = self.char_pages.pop(uuid, None)
         if page:
-            page["frame"].destroy()
+            # grid_forget: CTk would replay a grid_remove'd frame's grid() on the next rescale
+            page.frame.grid_forget()
+            self._page_pool[uuid] = page
+            while len(self._page_pool) > self.max_pooled_pages:
+                _old_uuid, old_page = self._page_pool.popitem(last=False)
+                old_page.frame.destroy()
         self.tab_titles.pop(uuid, None)
         if self.browser_tabs:
             other_uuid = next(iter(self.browser_tabs.keys()))
@@ -617,21 +875,19 @@ class BLEBrowserApp(ctk.CTk):
     def _ensure_char_page(self, uuid: str):
         if uuid in self.char_pages:
             return
+        pooled = self._page_pool.pop(uuid, None)
+        if pooled:
+            self.char_pages[uuid] = pooled
+            self._refresh_page_header(uuid)
+            return
         page = ctk.CTkFrame(self.char_pages_container)
         page.grid(row=0, column=0, sticky="nsew")
         page.grid_columnconfigure(0, weight=1)
         page.grid_rowconfigure(2, weight=1)
 
-        # Header shows display name + uuid + props
-        title = self.tab_titles.get(uuid, uuid)
-        props_text = "-"
-        if uuid in self.char_index:
-            _svc, ch, _h = self.char_index[uuid]
-            props_text = ",".join(getattr(ch, "properties", [])) or "-"
-
         props_lbl = ctk.CTkLabel(
             page,
-            text=f"{title}  [{uuid}]\nProps: {props_text}",
+            text=self._page_header_text(uuid),
             anchor="w",
             justify="left",
         )
@@ -649,32 +905,35 @@ class BLEBrowserApp(ctk.CTk):
         text = ctk.CTkTextbox(page, wrap="none", font=("Consolas", 11))
         text.grid(row=2, column=0, sticky="nsew", padx=6, pady=6)
 
-        self.char_pages[uuid] = {
-            "frame": page,
-            "props": props_lbl,
-            "text": text,
-            "btn_read": btn_read,
-            "btn_sub": btn_sub,
-            "btn_write": btn_write,
-        }
+        self.char_pages[uuid] = CharPage(page, props_lbl, text, btn_read, btn_sub, btn_write)
 
     def _refresh_page_header(self, uuid: str):
         page = self.char_pages.get(uuid)
         if not page:
             return
+        header = self._page_header_text(uuid)
+        if header != page.header:
+            page.props.configure(text=header)
+            page.header = header
+
+    def _page_header_text(self, uuid: str) -> str:
+        """Display name + uuid + props."""
         title = self.tab_titles.get(uuid, uuid)
-        props_text = "-"
-        if uuid in self.char_index:
-            _svc, ch, _h = self.char_index[uuid]
-            props_text = ",".join(getattr(ch, "properties", [])) or "-"
-        page["props"].configure(text=f"{title}  [{uuid}]\nProps: {props_text}")
+        props_text = self.char_index[uuid][4] if uuid in self.char_index else "-"
+        return f"{title}  [{uuid}]\nProps: {props_text}"
 
     def _show_char_page(self, uuid: str):
         for u, page in self.char_pages.items():
-            page["frame"].grid_remove()
+            page.frame.grid_forget()
         if uuid in self.char_pages:
-            self.char_pages[uuid]["frame"].grid()
-            self.char_pages[uuid]["btn_sub"].configure(
+            page = self.char_pages[uuid]
+            page.frame.grid(row=0, column=0, sticky="nsew")
+            if page.backlog:
+                page.text.insert("end", "\n".join(page.backlog) + "\n")
+                page.backlog.clear()
+                self._trim_textbox(page.text)
+            page.text.see("end")
+            page.btn_sub.configure(
                 text=("Unsubscribe" if self.notify_active_uuid == uuid else "Subscribe")
             )
             self._refresh_page_header(uuid)
@@ -683,61 +942,103 @@ class BLEBrowserApp(ctk.CTk):
         page = self.char_pages.get(uuid)
         if not page:
             return
-        text: ctk.CTkTextbox = page["text"]  # type: ignore
+        if uuid != self.active_tab_uuid:
+            # hidden: keep a bounded backlog instead of touching the widget
+            page.backlog.extend(line.split("\n"))
+            return
+        text = page.text
         text.insert("end", line + "\n")
+        self._trim_textbox(text)
         text.see("end")
 
     # wrappers for page buttons
     def _read_from(self, uuid: str):
-        fut = self.bridge.run_coro(self._read_async(uuid))
-        fut.add_done_callback(lambda _f: None)
+        self.bridge.fire(self._read_async(uuid))
 
     def _write_from(self, uuid: str):
         payload = self._get_bytes_from_editor()
         if payload is None:
             return
-        fut = self.bridge.run_coro(self._write_async(uuid, payload))
-        fut.add_done_callback(lambda _f: None)
+        self.bridge.fire(self._write_async(uuid, payload))
 
     def _toggle_notify_for(self, uuid: str):
         if self.notify_active_uuid == uuid:
-            fut = self.bridge.run_coro(self._stop_notify_async(uuid))
-            fut.add_done_callback(lambda _f: self.after(0, self._notify_stopped_ui_for, uuid))
+            self.bridge.fire(self._stop_notify_async(uuid), partial(self._post_to_tk, self._notify_stopped_ui_for, uuid))
         else:
-            fut = self.bridge.run_coro(self._start_notify_async(uuid))
-            fut.add_done_callback(lambda _f: self.after(0, self._notify_started_ui_for, uuid))
+            self.bridge.fire(self._start_notify_async(uuid), partial(self._post_to_tk, self._notify_started_ui_for, uuid))
 
     def _notify_started_ui_for(self, uuid: str):
         if self.char_var.get() == uuid:
             self.notify_btn.configure(text="Unsubscribe")
+            self._ctl_state = None
         page = self.char_pages.get(uuid)
         if page:
-            page["btn_sub"].configure(text="Unsubscribe")
+            page.btn_sub.configure(text="Unsubscribe")
         if self.active_tab_uuid == uuid:
             self._select_browser_tab(uuid)
 
     def _notify_stopped_ui_for(self, uuid: str):
         if self.char_var.get() == uuid:
             self.notify_btn.configure(text="Subscribe")
+            self._ctl_state = None
         page = self.char_pages.get(uuid)
         if page:
-            page["btn_sub"].configure(text="Subscribe")
+            page.btn_sub.configure(text="Subscribe")
         if self.active_tab_uuid == uuid:
             self._select_browser_tab(uuid)
 
     def _notification_handler(self, sender: int, data: bytearray):
-        uuid = "Unknown"
-        for char_uuid, (_svc_uuid, _ch, handle) in self.char_index.items():
-            if handle == sender:
-                uuid = char_uuid
-                break
-        hex_str = " ".join(f"{b:02X}" for b in data[:64])
-        msg = f"[NOTIF {uuid}] {hex_str}" + (f" … (len={len(data)})" if len(data) > 64 else f" (len={len(data)})")
-        self.after(0, lambda m=msg: self.log(m))
-        self.after(0, lambda u=uuid, m=msg: self._append_to_char_page(u, m))
-        if len(data) >= 34:
-            decoded = self._decode_status(data)
-            self.after(0, lambda d=decoded: self._update_decoded(d))
+        uuid = self._handle_to_uuid.get(sender, "Unknown")
+        # snapshot only when bleak hands us a mutable buffer
+        frame = data if isinstance(data, bytes) else bytes(data)
+        with self._notif_lock:
+            self._notif_queue.append((uuid, frame))
+            if self._notif_drain_armed or self._closing:
+                return
+            self._notif_drain_armed = True
+        # first packet after a drain: flush when Tk is idle, but no sooner than _notif_drain_ms
+        wait = self._notif_last_drain + self._notif_drain_ms / 1000 - time.monotonic()
+        if wait > 0:
+            self._notif_drain_job = self.after(int(wait * 1000) + 1, self._drain_notifications)
+        else:
+            self._notif_drain_job = self.after_idle(self._drain_notifications)
+
+    def _drain_notifications(self):
+        """Flush queued notifications to the UI in one pass; the next packet re-arms it."""
+        self._notif_drain_job = None
+        with self._notif_lock:
+            batch = list(self._notif_queue)
+            self._notif_queue.clear()
+            self._notif_drain_armed = False
+        self._notif_last_drain = time.monotonic()
+
+        if batch:
+            lines: List[str] = []
+            per_page: DefaultDict[str, List[str]] = collections.defaultdict(list)
+            latest_status: Optional[bytes] = None
+            pages = self.char_pages
+            for uuid, data in batch:
+                msg = self._format_value_line("NOTIF", uuid, data)
+                lines.append(msg)
+                if uuid in pages:  # no open tab -> nothing to append to
+                    per_page[uuid].append(msg)
+                if len(data) >= STATUS_STRUCT.size:
+                    latest_status = data
+            self.log("\n".join(lines))
+            for uuid, page_lines in per_page.items():
+                self._append_to_char_page(uuid, "\n".join(page_lines))
+            if latest_status is not None:
+                if self.state() == "iconic":
+                    # nobody is looking; decode only the newest frame once restored
+                    self._deferred_status = latest_status
+                else:
+                    self._update_decoded(self._decode_status(latest_status))
+
+    def _on_map(self, event):
+        # the root binding also sees child <Map> events
+        if event.widget is self and self._deferred_status is not None:
+            data, self._deferred_status = self._deferred_status, None
+            self._update_decoded(self._decode_status(data))
 
     # ---------- Byte Editor ----------
     def on_create_byte_editor(self):
@@ -746,29 +1047,44 @@ class BLEBrowserApp(ctk.CTk):
             if size <= 0:
                 self.log("Error: Byte size must be a positive integer")
                 return
+            if size > self.max_byte_size:
+                self.log(f"Error: Byte size must be at most {self.max_byte_size} (GATT attribute limit)")
+                return
             if size > 64:
                 self.log("Warning: Large byte size may affect performance")
-            for w in self.byte_editor_frame.winfo_children():
-                w.destroy()
-            self.byte_entries = []
-            self.byte_name_entries = []
-
-            header = ctk.CTkFrame(self.byte_editor_frame, fg_color="transparent")
-            header.grid(row=0, column=0, columnspan=3, sticky="ew", pady=(0, 5))
-            ctk.CTkLabel(header, text="Byte Name", font=("Arial", 11, "bold")).grid(row=0, column=0, padx=(0, 10))
-            ctk.CTkLabel(header, text="Value (Hex)", font=("Arial", 11, "bold")).grid(row=0, column=1, padx=(0, 10))
-            ctk.CTkLabel(header, text="Index", font=("Arial", 11, "bold")).grid(row=0, column=2)
-
+            frame = self.byte_editor_frame
+            if not self._byte_editor_header:
+                # header survives rebuilds
+                bold = ("Arial", 11, "bold")
+                ctk.CTkLabel(frame, text="Byte Name", font=bold).grid(row=0, column=0, padx=(0, 10), pady=(0, 5))
+                ctk.CTkLabel(frame, text="Value (Hex)", font=bold).grid(row=0, column=1, padx=(0, 10), pady=(0, 5))
+                ctk.CTkLabel(frame, text="Index", font=bold).grid(row=0, column=2, pady=(0, 5))
+                self._byte_editor_header = True
+
+            # reuse rows from earlier editors; only the size delta creates or hides widgets
+            rows = self._byte_editor_rows
             for i in range(size):
-                row = ctk.CTkFrame(self.byte_editor_frame, fg_color="transparent")
-                row.grid(row=i+1, column=0, columnspan=3, sticky="ew", pady=2)
+                if i < len(rows):
+                    name_var, value_var, cells = rows[i]
+                    name_var.set(f"Byte {i+1}")
+                    value_var.set("00")
+                    if not cells[0].winfo_manager():
+                        self._grid_byte_row(i, cells)
+                    continue
                 name_var = ctk.StringVar(value=f"Byte {i+1}")
-                ctk.CTkEntry(row, textvariable=name_var, width=120).grid(row=0, column=0, padx=(0, 10))
-                self.byte_name_entries.append(name_var)
+                name_entry = ctk.CTkEntry(frame, textvariable=name_var, width=120)
                 value_var = ctk.StringVar(value="00")
-                ctk.CTkEntry(row, textvariable=value_var, width=80).grid(row=0, column=1, padx=(0, 10))
-                self.byte_entries.append(value_var)
-                ctk.CTkLabel(row, text=f"#{i}", text_color="gray").grid(row=0, column=2)
+                value_entry = ctk.CTkEntry(frame, textvariable=value_var, width=80)
+                index_lbl = ctk.CTkLabel(frame, text=f"#{i}", text_color="gray")
+                cells = (name_entry, value_entry, index_lbl)
+                self._grid_byte_row(i, cells)
+                rows.append((name_var, value_var, cells))
+            for _name_var, _value_var, cells in rows[size:]:
+                # grid_forget, not grid_remove: CTk replays the last grid() call on rescale
+                for c in cells:
+                    c.grid_forget()
+            self.byte_name_entries = [r[0] for r in rows[:size]]
+            self.byte_entries = [r[1] for r in rows[:size]]
 
             self.bytes_info_lbl.configure(text=f"Bytes: {size}")
             self.log(f"Created byte editor with {size} bytes")
@@ -776,10 +1092,24 @@ class BLEBrowserApp(ctk.CTk):
         except ValueError:
             self.log("Error: Please enter a valid integer for byte size")
 
+    @staticmethod
+    def _grid_byte_row(i: int, cells):
+        name_entry, value_entry, index_lbl = cells
+        name_entry.grid(row=i+1, column=0, padx=(0, 10), pady=2)
+        value_entry.grid(row=i+1, column=1, padx=(0, 10), pady=2)
+        index_lbl.grid(row=i+1, column=2, pady=2)
+
     def _get_bytes_from_editor(self):
         if not self.byte_entries:
             self.log("Error: No byte editor created. Please create one first.")
             return None
+        # fast path: every cell is one or two hex digits -> single C-level parse
+        values = [value_var.get().strip() for value_var in self.byte_entries]
+        if all(0 < len(v) <= 2 for v in values):
+            try:
+                return bytes.fromhex("".join(v.rjust(2, "0") for v in values))
+            except ValueError:
+                pass  # fall through for the per-byte error message
         bytes_list = []
         for i, value_var in enumerate(self.byte_entries):
             value = value_var.get().strip()
@@ -797,43 +1127,25 @@ class BLEBrowserApp(ctk.CTk):
         return bytes(bytes_list)
 
     # ---------- Decoding ----------
-    @staticmethod
-    def _u16_be(hi: int, lo: int) -> int:
-        return ((hi & 0xFF) << 8) | (lo & 0xFF)
-
     def _decode_status(self, payload: bytes) -> Dict[str, Union[List[int], int]]:
-        b = payload
-        if len(b) < 34:
+        if len(payload) < STATUS_STRUCT.size:
             return {}
-        current_status = b[0]
-        error_code = b[1]
-
-        def pairs(start, count):
-            out = []
-            for i in range(count):
-                hi = b[start + 2 * i]
-                lo = b[start + 2 * i + 1]
-                out.append(self._u16_be(hi, lo))
-            return out
-
-        temps = pairs(2, 4)
-        press = pairs(10, 6)
-        levels = pairs(22, 2)
-        flows = pairs(26, 4)
+        current_status, error_code, *rest = STATUS_STRUCT.unpack_from(payload)
 
         return {
             "current_status": current_status,
             "error_code": error_code,
-            "temperature": temps,
-            "pressure": press,
-            "level": levels,
-            "flowrate": flows,
+            "temperature": list(rest[0:4]),
+            "pressure": list(rest[4:10]),
+            "level": list(rest[10:12]),
+            "flowrate": list(rest[12:16]),
         }
 
     def _clear_decoded(self):
-        for child in self.decoded_frame.winfo_children():
-            child.destroy()
-        self._decoded_rows.clear()
+        # hide rather than destroy; _update_decoded re-packs the same widgets
+        self._deferred_status = None
+        for row, _v, _last in self._decoded_rows.values():
+            row.pack_forget()
 
     def _update_decoded(self, d: Dict[str, Union[List[int], int]]):
         if not d:
@@ -841,6 +1153,9 @@ class BLEBrowserApp(ctk.CTk):
 
         def ensure_row(name: str):
             if name in self._decoded_rows:
+                row = self._decoded_rows[name][0]
+                if not row.winfo_manager():
+                    row.pack(fill="x", padx=6, pady=2)
                 return self._decoded_rows[name]
             row = ctk.CTkFrame(self.decoded_frame, fg_color="transparent")
             row.pack(fill="x", padx=6, pady=2)
@@ -848,15 +1163,15 @@ class BLEBrowserApp(ctk.CTk):
             k.pack(side="left")
             v = ctk.CTkLabel(row, text="", anchor="w", wraplength=800)
             v.pack(side="left", fill="x", expand=True)
-            self._decoded_rows[name] = (k, v)
+            self._decoded_rows[name] = (row, v, "")
             return self._decoded_rows[name]
 
         def set_val(name: str, val: Union[int, List[int]]):
-            _, v = ensure_row(name)
-            if isinstance(val, list):
-                v.configure(text=", ".join(str(x) for x in val))
-            else:
-                v.configure(text=str(val))
+            row, v, last = ensure_row(name)
+            text = ", ".join(str(x) for x in val) if isinstance(val, list) else str(val)
+            if text != last:
+                v.configure(text=text)
+                self._decoded_rows[name] = (row, v, text)
 
         set_val("current_status", d["current_status"])
         set_val("error_code", d["error_code"])
@@ -867,12 +1182,23 @@ class BLEBrowserApp(ctk.CTk):
 
     # ---------- Close ----------
     def on_close(self):
+        # stops new posts from the bridge thread (_post_to_tk, notify drain, scan refresh);
+        # flipped under the locks so the two timer-arming callbacks see it consistently
+        with self._notif_lock, self._scan_lock:
+            self._closing = True
         try:
             if self.client and getattr(self.client, "is_connected", False):
                 self.bridge.run_coro(self._disconnect_async()).result(timeout=2.0)
         except Exception:
             pass
         self.bridge.stop()
+        # the join above can time out, so a callback already past its _closing check may
+        # still slip one in; mainloop ends with destroy() before any such callback runs
+        for name in ("_notif_drain_job", "_scan_refresh_job", "_scale_job"):
+            job = getattr(self, name)
+            if job:
+                self.after_cancel(job)
+                setattr(self, name, None)
         self.destroy()
 
 